@@ -0,0 +1,61 @@
+"""
+Shared HTTP client pool for LLM providers
+"""
+
+from typing import Callable, Dict
+
+import httpx
+
+# One pooled client per base URL, shared by every provider instance that
+# talks to the same host, so TCP/TLS connections are reused across them
+_SHARED: Dict[str, httpx.AsyncClient] = {}
+# Counted per client object, so a replacement client for the same base URL
+# is never closed by providers still releasing the one it replaced
+_REFCOUNTS: Dict[httpx.AsyncClient, int] = {}
+
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+
+class BearerAuth(httpx.Auth):
+    """Bearer token auth that reads the token when each request is sent"""
+
+    def __init__(self, token_fn: Callable[[], str]):
+        self.token_fn = token_fn
+
+    def auth_flow(self, request: httpx.Request):
+        request.headers["Authorization"] = f"Bearer {self.token_fn()}"
+        yield request
+
+
+async def get_shared_client(base_url: str) -> httpx.AsyncClient:
+    """Return the shared client for base_url, creating it on first use"""
+    client = _SHARED.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=True,
+            limits=_LIMITS,
+            timeout=_TIMEOUT
+        )
+        _SHARED[base_url] = client
+        _REFCOUNTS[client] = 0
+
+    _REFCOUNTS[client] += 1
+    return client
+
+
+async def release_shared_client(client: httpx.AsyncClient):
+    """Drop a reference to a shared client, closing it when unused"""
+    if client not in _REFCOUNTS:
+        return
+
+    _REFCOUNTS[client] -= 1
+    if _REFCOUNTS[client] > 0:
+        return
+
+    del _REFCOUNTS[client]
+    for base_url, shared in list(_SHARED.items()):
+        if shared is client:
+            del _SHARED[base_url]
+    await client.aclose()
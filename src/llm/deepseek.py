@@ -2,23 +2,92 @@
 DeepSeek AI Provider Implementation
 """
 
+import asyncio
+import hashlib
+import json
+import os
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple
+
 import httpx
-from typing import Optional, Dict, Any
-from pydantic import BaseModel
+import msgspec
+from prometheus_client import Counter, Histogram
 
+from src.llm._http import BearerAuth, get_shared_client, release_shared_client
 from src.llm.base import BaseLLMProvider, LLMConfig
+from src.llm.providers import PROVIDERS
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-class DeepSeekResponse(BaseModel):
+# Optional chat completion parameters callers may pass through to the API;
+# anything else in generate()'s kwargs is not sent
+_API_PARAMS = frozenset({
+    "frequency_penalty",
+    "presence_penalty",
+    "top_p",
+    "stop",
+    "response_format",
+    "tools",
+    "tool_choice",
+    "logprobs",
+    "top_logprobs",
+    "user",
+})
+
+# Request parameters that do not change the generated output and are
+# therefore left out of the response cache key
+_CACHE_IGNORED_PARAMS = frozenset({"stream", "stream_options", "user"})
+
+# DeepSeek pricing per token, bound once from the provider registry
+_DEEPSEEK_IN = PROVIDERS["deepseek"].in_cost
+_DEEPSEEK_OUT = PROVIDERS["deepseek"].out_cost
+
+# Metrics for sizing the response cache from real hit rates
+REQUESTS = Counter(
+    "deepseek_requests_total",
+    "DeepSeek generate calls by cache outcome",
+    ["outcome"]
+)
+LATENCY = Histogram(
+    "deepseek_latency_seconds",
+    "DeepSeek API request latency (to first byte for streamed requests)"
+)
+TOKENS_SAVED = Counter(
+    "deepseek_tokens_saved_total",
+    "Tokens not billed because a cached or coalesced response was served"
+)
+
+class DeepSeekMessage(msgspec.Struct):
+    """Message returned in a DeepSeek choice"""
+    role: str
+    content: Optional[str] = None
+
+class DeepSeekChoice(msgspec.Struct):
+    """Single completion choice in a DeepSeek response"""
+    index: int
+    message: DeepSeekMessage
+    finish_reason: Optional[str] = None
+
+class DeepSeekUsage(msgspec.Struct):
+    """Token counts billed for a DeepSeek request
+
+    Nested detail objects (completion_tokens_details, ...) are ignored.
+    """
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+
+class DeepSeekResponse(msgspec.Struct):
     """DeepSeek API response format"""
     id: str
     object: str
     created: int
     model: str
-    choices: list
-    usage: Dict[str, int]
+    choices: List[DeepSeekChoice]
+    usage: DeepSeekUsage
 
 class DeepSeekProvider(BaseLLMProvider):
     """DeepSeek AI provider implementation"""
@@ -27,17 +96,39 @@ class DeepSeekProvider(BaseLLMProvider):
         super().__init__(config)
         self.base_url = config.base_url or "https://api.deepseek.com"
         self.client = None
+        self._api_key = config.api_key or os.environ.get("DEEPSEEK_API_KEY")
+        
+        # Exact-match response cache (LRU, optional TTL in seconds)
+        self._cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self.max_entries = getattr(config, "cache_max_entries", 256)
+        self.cache_ttl = getattr(config, "cache_ttl", None)
+        
+        # Requests currently on the wire, keyed like the cache
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
+        # API spend avoided by serving cached or coalesced responses
+        self.cost_saved = 0.0
+        
+        # Optional second cache tier matching paraphrased prompts
+        self._semantic = None
+        if getattr(config, "semantic_cache", False):
+            try:
+                from src.llm.semantic_cache import SemanticCache
+            except ImportError as e:
+                logger.error(f"Semantic cache disabled, dependencies missing: {e}")
+            else:
+                self._semantic = SemanticCache(
+                    threshold=getattr(config, "semantic_cache_threshold", 0.9),
+                    max_entries=self.max_entries
+                )
     
     async def initialize(self):
         """Initialize DeepSeek client"""
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers={
-                "Authorization": f"Bearer {self.config.api_key}",
-                "Content-Type": "application/json"
-            },
-            timeout=30.0
-        )
+        if self.client is None:
+            self.client = await get_shared_client(self.base_url)
+        # Credentials are resolved per request so one pool can serve many
+        # keys and key rotation does not require a new client
+        self._auth = BearerAuth(lambda: self._api_key)
         logger.info(f"DeepSeek provider initialized with model: {self.config.model}")
     
     async def generate(self, prompt: str, **kwargs) -> Dict[str, Any]:
@@ -45,55 +136,281 @@ class DeepSeekProvider(BaseLLMProvider):
         if not self.client:
             raise RuntimeError("DeepSeek provider not initialized")
         
+        payload = self._build_payload(prompt, kwargs)
+        key = self._cache_key(payload)
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.debug("DeepSeek cache hit")
+            self._record_saving("hit", cached["usage"])
+            return cached
+        
+        # Identical request already on the wire: wait for its result
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.debug("DeepSeek request coalesced with in-flight call")
+            result = await asyncio.shield(inflight)
+            self._record_saving("coalesced", result["usage"])
+            return result
+        
+        # Run the request in its own task so cancelling any one caller,
+        # including the first, does not cancel it for the others
+        task = asyncio.create_task(self._resolve(key, payload))
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._inflight_done(key, t))
+        
+        return await asyncio.shield(task)
+    
+    def _inflight_done(self, key: str, task: asyncio.Task):
+        """Forget a finished in-flight request"""
+        self._inflight.pop(key, None)
+        # Mark any failure as retrieved: if every caller was cancelled,
+        # nobody awaits the task and asyncio would warn about it
+        if not task.cancelled():
+            task.exception()
+    
+    async def _resolve(self, key: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a request from the semantic cache or the API"""
+        semantic = self._semantic
+        if semantic is None:
+            return await self._dispatch(key, payload)
+        
+        # Namespace semantic matches by the output-affecting params
+        namespace = self._cache_key({**payload, "messages": []})
+        embedding = None
+        
+        # The semantic tier is best effort: on any failure fall through to
+        # the API, and give up on the tier entirely if its model won't load
+        try:
+            embedding = await semantic.embed(payload["messages"][0]["content"])
+            result = semantic.lookup(embedding, namespace)
+        except Exception as e:
+            result = None
+            if not semantic.loaded:
+                logger.error(f"Semantic cache failed to load, disabling it: {e}")
+                self._semantic = None
+            else:
+                logger.warning(f"Semantic cache lookup failed: {e}")
+        
+        if result is not None:
+            logger.debug("DeepSeek semantic cache hit")
+            self._record_saving("semantic_hit", result["usage"])
+            self._cache_put(key, result)
+            return result
+        
+        result = await self._dispatch(key, payload)
+        
+        if embedding is not None:
+            try:
+                semantic.add(embedding, namespace, result)
+            except Exception as e:
+                logger.warning(f"Semantic cache update failed: {e}")
+        
+        return result
+    
+    async def generate_stream(self, prompt: str, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream text from DeepSeek API as it is generated
+        
+        Yields dicts with a "content" delta. The final chunk carries the
+        request's "usage" and "cost"; a cache hit yields a single chunk
+        holding the full cached response.
+        """
+        if not self.client:
+            raise RuntimeError("DeepSeek provider not initialized")
+        
+        payload = self._build_payload(prompt, kwargs)
+        key = self._cache_key(payload)
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.debug("DeepSeek cache hit")
+            self._record_saving("hit", cached["usage"])
+            yield cached
+            return
+        
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
+        
+        model = payload["model"]
+        usage: Dict[str, int] = {}
+        parts = []
+        REQUESTS.labels("miss").inc()
+        
+        started = time.perf_counter()
+        
         try:
-            response = await self.client.post(
+            async with self.client.stream(
+                "POST",
                 "/chat/completions",
-                json={
-                    "model": self.config.model or "deepseek-chat",
-                    "messages": [{"role": "user", "content": prompt}],
-                    "temperature": self.config.temperature,
-                    "max_tokens": self.config.max_tokens,
-                    **kwargs
-                }
-            )
+                auth=self._auth,
+                headers={"Content-Type": "application/json"},
+                content=msgspec.json.encode(payload)
+            ) as response:
+                # Time only up to the response headers; the rest of the body
+                # is paced by how fast the caller consumes the stream
+                LATENCY.observe(time.perf_counter() - started)
+                response.raise_for_status()
+                
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+                    
+                    chunk = msgspec.json.decode(data)
+                    model = chunk.get("model", model)
+                    if chunk.get("usage"):
+                        usage = chunk["usage"]
+                    
+                    for choice in chunk.get("choices") or []:
+                        delta = (choice.get("delta") or {}).get("content")
+                        if delta:
+                            parts.append(delta)
+                            yield {"content": delta, "model": model}
+                            
+        except Exception as e:
+            logger.error(f"DeepSeek API error: {e}")
+            raise
+        
+        result = {
+            "content": "".join(parts),
+            "model": model,
+            "usage": usage,
+            "cost": self._calculate_cost(usage)
+        }
+        self._cache_put(key, result)
+        
+        yield {"content": "", "model": model, "usage": usage, "cost": result["cost"]}
+    
+    def _build_payload(self, prompt: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the chat completion request body
+        
+        A ``config`` kwarg (as passed by LLMManager) and explicit ``model``,
+        ``temperature`` or ``max_tokens`` kwargs override the provider
+        config. Only whitelisted API parameters are forwarded.
+        """
+        config = kwargs.get("config") or self.config
+        
+        ignored = kwargs.keys() - _API_PARAMS - {"config", "model", "temperature", "max_tokens"}
+        if ignored:
+            logger.debug(f"Ignoring unsupported DeepSeek parameters: {sorted(ignored)}")
+        
+        return {
+            "model": kwargs.get("model") or config.model or "deepseek-chat",
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": kwargs.get("temperature", config.temperature),
+            "max_tokens": kwargs.get("max_tokens", config.max_tokens),
+            **{k: v for k, v in kwargs.items() if k in _API_PARAMS}
+        }
+    
+    async def _dispatch(self, key: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a chat completion request and cache the result"""
+        REQUESTS.labels("miss").inc()
+        
+        try:
+            with LATENCY.time():
+                response = await self.client.post(
+                    "/chat/completions",
+                    auth=self._auth,
+                    headers={"Content-Type": "application/json"},
+                    content=msgspec.json.encode(payload)
+                )
             
             response.raise_for_status()
-            data = response.json()
+            data = msgspec.json.decode(response.content, type=DeepSeekResponse)
             
-            return {
-                "content": data["choices"][0]["message"]["content"],
-                "model": data["model"],
-                "usage": data["usage"],
-                "cost": self._calculate_cost(data["usage"])
+            usage = msgspec.structs.asdict(data.usage)
+            result = {
+                "content": data.choices[0].message.content or "",
+                "model": data.model,
+                "usage": usage,
+                "cost": self._calculate_cost(usage)
             }
+            self._cache_put(key, result)
+            
+            return result
             
         except Exception as e:
             logger.error(f"DeepSeek API error: {e}")
             raise
     
-    def _calculate_cost(self, usage: Dict[str, int]) -> float:
-        """Calculate cost based on usage"""
-        # DeepSeek pricing (example, check actual pricing)
-        input_cost_per_token = 0.0000014  # $0.14 per 1M tokens
-        output_cost_per_token = 0.0000028  # $0.28 per 1M tokens
+    def _cache_key(self, payload: Dict[str, Any]) -> str:
+        """Build a content-addressable cache key for a request body"""
+        material = {
+            k: v for k, v in payload.items() if k not in _CACHE_IGNORED_PARAMS
+        }
+        material["messages"] = [
+            {**message, "content": unicodedata.normalize("NFC", message["content"])}
+            for message in payload["messages"]
+        ]
+        encoded = json.dumps(material, sort_keys=True)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached response, or None on miss/expiry"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
         
-        input_cost = usage.get("prompt_tokens", 0) * input_cost_per_token
-        output_cost = usage.get("completion_tokens", 0) * output_cost_per_token
+        stored_at, result = entry
+        if self.cache_ttl is not None and time.monotonic() - stored_at > self.cache_ttl:
+            del self._cache[key]
+            return None
+        
+        self._cache.move_to_end(key)
+        return result
+    
+    def _cache_put(self, key: str, result: Dict[str, Any]):
+        """Store a response, evicting the least recently used entries"""
+        if self.max_entries <= 0:
+            return
         
-        return input_cost + output_cost
+        self._cache[key] = (time.monotonic(), result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+    
+    def _record_saving(self, outcome: str, usage: Dict[str, int]):
+        """Account for a request answered without calling the API"""
+        REQUESTS.labels(outcome).inc()
+        TOKENS_SAVED.inc(usage.get("prompt_tokens", 0) + usage.get("completion_tokens", 0))
+        self.cost_saved += self._calculate_cost(usage)
+    
+    def _calculate_cost(self, usage: Dict[str, int]) -> float:
+        """Calculate cost based on usage"""
+        return (
+            usage.get("prompt_tokens", 0) * _DEEPSEEK_IN
+            + usage.get("completion_tokens", 0) * _DEEPSEEK_OUT
+        )
+    
+    def reload_key(self):
+        """Pick up a rotated API key from the environment (SIGHUP)"""
+        self._api_key = os.environ.get("DEEPSEEK_API_KEY") or self._api_key
+        logger.info("DeepSeek API key reloaded")
     
     async def test_connection(self) -> bool:
         """Test connection to DeepSeek API"""
         try:
-            response = await self.client.get("/models")
-            return response.status_code == 200
-        except:
+            # HEAD avoids downloading the model list just to check status
+            response = await self.client.head(
+                "/models", auth=self._auth, timeout=2.0
+            )
+            if response.status_code == 405:
+                response = await self.client.get(
+                    "/models", auth=self._auth, timeout=2.0
+                )
+            return response.status_code < 400
+        except (httpx.HTTPError, asyncio.TimeoutError, OSError) as e:
+            logger.debug(f"DeepSeek test_connection failed: {e}")
             return False
     
     async def close(self):
         """Cleanup resources"""
         if self.client:
-            await self.client.aclose()
+            client, self.client = self.client, None
+            await release_shared_client(client)
     
     def is_connected(self) -> bool:
         """Check if provider is connected"""
@@ -34,6 +34,10 @@ class LLMConfig:
     max_tokens: int = 4096
     enabled: bool = True
     priority: int = 1
+    cache_max_entries: int = 256
+    cache_ttl: Optional[float] = None
+    semantic_cache: bool = False
+    semantic_cache_threshold: float = 0.9
 
 class LLMResponse(BaseModel):
     """Standardized LLM response"""
@@ -70,7 +74,11 @@ class LLMManager:
                     temperature=config_data.get('temperature', 0.7),
                     max_tokens=config_data.get('max_tokens', 4096),
                     enabled=config_data.get('enabled', True),
-                    priority=config_data.get('priority', 1)
+                    priority=config_data.get('priority', 1),
+                    cache_max_entries=config_data.get('cache_max_entries', 256),
+                    cache_ttl=config_data.get('cache_ttl'),
+                    semantic_cache=config_data.get('semantic_cache', False),
+                    semantic_cache_threshold=config_data.get('semantic_cache_threshold', 0.9)
                 )
                 
                 self.configs[provider] = config
@@ -249,6 +257,12 @@ class LLMManager:
         
         return providers_info
     
+    def reload_keys(self):
+        """Reload API keys for providers that support key rotation"""
+        for instance in self.providers.values():
+            if hasattr(instance, "reload_key"):
+                instance.reload_key()
+    
     async def test_all_providers(self) -> Dict[str, bool]:
         """Test connectivity to all providers"""
         results = {}
@@ -0,0 +1,58 @@
+"""
+Static metadata for supported LLM providers
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+@dataclass(frozen=True)
+class ProviderSpec:
+    """Defaults, validation and pricing for an LLM provider"""
+    display_name: str
+    default_model: str
+    in_cost: Optional[float] = None  # $ per prompt token
+    out_cost: Optional[float] = None  # $ per completion token
+    key_prefix: Optional[str] = None
+
+    def validate_key(self, api_key: str) -> bool:
+        """Check an API key looks plausible for this provider"""
+        if len(api_key) <= 10:
+            return False
+        return self.key_prefix is None or api_key.startswith(self.key_prefix)
+
+PROVIDERS: Dict[str, ProviderSpec] = {
+    "deepseek": ProviderSpec(
+        display_name="DeepSeek AI",
+        default_model="deepseek-chat",
+        in_cost=0.0000014,  # $0.14 per 1M tokens (example, check actual pricing)
+        out_cost=0.0000028,  # $0.28 per 1M tokens
+        key_prefix="sk-"
+    ),
+    "mistral": ProviderSpec(
+        display_name="Mistral AI",
+        default_model="mistral-medium"
+    ),
+    "openai": ProviderSpec(
+        display_name="OpenAI",
+        default_model="gpt-4-turbo-preview",
+        key_prefix="sk-"
+    ),
+    "anthropic": ProviderSpec(
+        display_name="Anthropic Claude",
+        default_model="claude-3-opus-20240229",
+        key_prefix="sk-ant-"
+    ),
+    "ollama": ProviderSpec(
+        display_name="Ollama (Local)",
+        default_model="llama2"
+    ),
+    "groq": ProviderSpec(
+        display_name="Groq",
+        default_model="mixtral-8x7b-32768",
+        key_prefix="gsk_"
+    ),
+    "together": ProviderSpec(
+        display_name="Together AI",
+        default_model="togethercomputer/llama-2-70b-chat"
+    ),
+}
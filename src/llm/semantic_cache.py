@@ -0,0 +1,107 @@
+"""
+Embedding-based semantic response cache
+
+Requires the optional ``semantic-cache`` dependencies
+(sentence-transformers with ONNX Runtime, faiss-cpu).
+"""
+
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+import faiss
+import numpy as np
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+class SemanticCache:
+    """Serve cached responses for prompts that are paraphrases of earlier ones"""
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        threshold: float = 0.9,
+        max_entries: int = 1024,
+        k: int = 5,
+        backend: str = "onnx"
+    ):
+        self.model_name = model_name
+        self.backend = backend
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.k = k
+
+        # The model (and its index) is loaded on first use, off the event
+        # loop, since importing and possibly downloading it takes seconds
+        self._model = None
+        self._index = None
+        self._load_lock = asyncio.Lock()
+        # Entry id -> (namespace, response), in insertion order
+        self._entries: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+        self._next_id = 0
+
+    def _load_model(self):
+        """Load the embedding model and build an empty index"""
+        from sentence_transformers import SentenceTransformer
+
+        # ONNX Runtime gives much faster CPU inference than the torch backend
+        model = SentenceTransformer(self.model_name, backend=self.backend)
+        dim = model.get_sentence_embedding_dimension()
+        # Inner product over normalized embeddings is cosine similarity
+        self._index = faiss.IndexIDMap(faiss.IndexFlatIP(dim))
+        self._model = model
+
+        logger.info(f"Semantic cache loaded model: {self.model_name} ({self.backend})")
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the embedding model has been loaded"""
+        return self._model is not None
+
+    async def embed(self, prompt: str) -> np.ndarray:
+        """Embed a prompt off the event loop"""
+        if self._model is None:
+            async with self._load_lock:
+                if self._model is None:
+                    await asyncio.to_thread(self._load_model)
+
+        embedding = await asyncio.to_thread(
+            self._model.encode, [prompt], normalize_embeddings=True
+        )
+        return np.asarray(embedding, dtype="float32")
+
+    def lookup(self, embedding: np.ndarray, namespace: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the closest cached response above the similarity threshold
+
+        Only entries stored under the same namespace (the request's
+        output-affecting parameters) are considered.
+        """
+        if not self._entries:
+            return None
+
+        scores, ids = self._index.search(embedding, min(self.k, len(self._entries)))
+
+        for score, entry_id in zip(scores[0], ids[0]):
+            # Results are sorted by descending similarity
+            if score < self.threshold:
+                break
+            entry = self._entries.get(int(entry_id))
+            if entry is not None and entry[0] == namespace:
+                return entry[1]
+
+        return None
+
+    def add(self, embedding: np.ndarray, namespace: str, response: Dict[str, Any]):
+        """Store a response, evicting the oldest entry when full"""
+        entry_id = self._next_id
+        self._next_id += 1
+
+        self._index.add_with_ids(embedding, np.array([entry_id], dtype="int64"))
+        self._entries[entry_id] = (namespace, response)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            del self._entries[oldest]
+            self._index.remove_ids(np.array([oldest], dtype="int64"))
@@ -5,39 +5,74 @@ Main entry point with graceful startup/shutdown
 """
 
 import asyncio
+import functools
 import signal
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from config.settings import settings
-from src.nostr.client import NostrClient
-from src.llm.manager import LLMManager
-from src.mcp.server import MCPServer
-from src.ui.web_app import WebUI
 from src.utils.logger import setup_logger
 
+# Heavy components are imported where they are used so that lightweight
+# subcommands (--help, list-providers, ...) start quickly
+if TYPE_CHECKING:
+    from src.nostr.client import NostrClient
+    from src.llm.manager import LLMManager
+    from src.mcp.server import MCPServer
+    from src.ui.web_app import WebUI
+
 console = Console()
 logger = setup_logger(__name__)
 app = typer.Typer(help="Dandelions - Nostr MCP Bot")
 
+_BANNER_STR = """
+╔══════════════════════════════════════════╗
+║         🌸 Dandelions Bot v1.0 🌸         ║
+║  Multi-LLM Nostr MCP Bot with Web UI     ║
+╚══════════════════════════════════════════╝
+        """
+
+@functools.cache
+def _banner():
+    """Build the startup banner panel once, on first use"""
+    from rich.panel import Panel
+    
+    return Panel(_BANNER_STR, border_style="cyan")
+
+async def _run_all(coros):
+    """
+    Run coroutines concurrently and re-raise the first failure
+
+    Unlike a bare gather, every coroutine has finished by the time an
+    error propagates, so none is left running behind shutdown().
+    """
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
 class DandelionsBot:
     """Main bot orchestrator"""
     
     def __init__(self):
-        self.nostr_client: Optional[NostrClient] = None
-        self.llm_manager: Optional[LLMManager] = None
-        self.mcp_server: Optional[MCPServer] = None
-        self.web_ui: Optional[WebUI] = None
+        self.nostr_client: Optional["NostrClient"] = None
+        self.llm_manager: Optional["LLMManager"] = None
+        self.mcp_server: Optional["MCPServer"] = None
+        self.web_ui: Optional["WebUI"] = None
         self.running = False
+        self._stop = asyncio.Event()
+        self._status_task: Optional[asyncio.Task] = None
         
     async def initialize(self):
         """Initialize all components"""
+        from src.nostr.client import NostrClient
+        from src.llm.manager import LLMManager
+        from src.mcp.server import MCPServer
+        
         try:
             console.print("[bold green]🌸 Starting Dandelions Bot...[/bold green]")
             
@@ -49,27 +84,26 @@ class DandelionsBot:
             self.llm_manager = LLMManager()
             await self.llm_manager.initialize()
             
-            # Initialize Nostr Client
-            console.print("[yellow]⚙️ Initializing Nostr Client...[/yellow]")
+            # Nostr, MCP and Web UI only depend on the LLM manager, so they
+            # can be brought up concurrently
+            console.print("[yellow]⚙️ Initializing Nostr Client, MCP Server and Web UI...[/yellow]")
             self.nostr_client = NostrClient(llm_manager=self.llm_manager)
-            await self.nostr_client.initialize()
-            
-            # Initialize MCP Server
-            console.print("[yellow]⚙️ Initializing MCP Server...[/yellow]")
             self.mcp_server = MCPServer(
                 nostr_client=self.nostr_client,
                 llm_manager=self.llm_manager
             )
-            await self.mcp_server.initialize()
+            components = [self.nostr_client, self.mcp_server]
             
-            # Initialize Web UI if enabled
             if settings.WEB_UI_ENABLED:
-                console.print("[yellow]⚙️ Initializing Web UI...[/yellow]")
+                from src.ui.web_app import WebUI
+                
                 self.web_ui = WebUI(
                     nostr_client=self.nostr_client,
                     llm_manager=self.llm_manager
                 )
-                await self.web_ui.initialize()
+                components.append(self.web_ui)
+            
+            await _run_all(component.initialize() for component in components)
             
             self.running = True
             console.print("[bold green]✅ Dandelions Bot initialized successfully![/bold green]")
@@ -81,22 +115,20 @@ class DandelionsBot:
     async def start(self):
         """Start all services"""
         try:
-            # Start Nostr client
-            await self.nostr_client.start()
-            
-            # Start MCP server
-            await self.mcp_server.start()
-            
-            # Start Web UI
+            # Start Nostr client, MCP server and Web UI concurrently
+            services = [self.nostr_client, self.mcp_server]
             if self.web_ui:
-                await self.web_ui.start()
+                services.append(self.web_ui)
+            await _run_all(service.start() for service in services)
             
-            # Display status
-            self._display_status()
+            # Render the status table off the event loop so relay traffic
+            # is not held up by it
+            self._status_task = asyncio.create_task(
+                asyncio.to_thread(self._display_status)
+            )
             
-            # Keep running
-            while self.running:
-                await asyncio.sleep(1)
+            # Keep running until shutdown is requested
+            await self._stop.wait()
                 
         except KeyboardInterrupt:
             console.print("\n[yellow]🛑 Received shutdown signal...[/yellow]")
@@ -105,8 +137,24 @@ class DandelionsBot:
         finally:
             await self.shutdown()
     
+    def request_shutdown(self):
+        """Wake the main loop so start() can shut down"""
+        self._stop.set()
+    
     async def shutdown(self):
         """Graceful shutdown"""
+        self.running = False
+        self._stop.set()
+        
+        # Let the status table finish printing before shutdown output; the
+        # render runs in a thread, so cancelling would not stop it anyway
+        if self._status_task:
+            status_task, self._status_task = self._status_task, None
+            try:
+                await status_task
+            except Exception as e:
+                logger.error(f"Error displaying status: {e}")
+        
         console.print("[yellow]🔄 Shutting down...[/yellow]")
         
         if self.nostr_client:
@@ -122,16 +170,12 @@ class DandelionsBot:
     
     def _display_banner(self):
         """Display startup banner"""
-        banner = """
-╔══════════════════════════════════════════╗
-║         🌸 Dandelions Bot v1.0 🌸         ║
-║  Multi-LLM Nostr MCP Bot with Web UI     ║
-╚══════════════════════════════════════════╝
-        """
-        console.print(Panel(banner, border_style="cyan"))
+        console.print(_banner())
     
     def _display_status(self):
         """Display system status"""
+        from rich.table import Table
+        
         table = Table(title="System Status", show_header=True)
         table.add_column("Component", style="cyan")
         table.add_column("Status", style="green")
@@ -179,11 +223,24 @@ def start(
     loop = asyncio.get_event_loop()
     
     def signal_handler():
-        loop.create_task(bot.shutdown())
+        bot.request_shutdown()
     
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, signal_handler)
     
+    # The setup wizard writes .env next to the settings file
+    env_file = (config_file.parent if config_file else Path("config")) / ".env"
+    
+    def reload_handler():
+        from dotenv import load_dotenv
+        
+        load_dotenv(env_file, override=True)
+        if bot.llm_manager:
+            bot.llm_manager.reload_keys()
+    
+    if hasattr(signal, "SIGHUP"):
+        loop.add_signal_handler(signal.SIGHUP, reload_handler)
+    
     try:
         loop.run_until_complete(bot.initialize())
         loop.run_until_complete(bot.start())
@@ -201,6 +258,8 @@ def setup():
 @app.command()
 def list_providers():
     """List available LLM providers"""
+    from src.llm.manager import LLMManager
+    
     manager = LLMManager()
     manager.list_providers()
 
@@ -210,8 +269,22 @@ def test_connection():
     # Implementation for connection testing
     pass
 
+def _install_event_loop_policy():
+    """Use the libuv-backed event loop when it is available"""
+    try:
+        if sys.platform == "win32":
+            import winloop as uvloop
+        else:
+            import uvloop
+    except ImportError:
+        logger.debug("uvloop not available, using the default asyncio event loop")
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 def main():
     """Main entry point"""
+    _install_event_loop_policy()
     app()
 
 if __name__ == "__main__":
@@ -7,7 +7,8 @@ import json
 from typing import Dict, List, Optional, Any
 from enum import Enum
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Response, WebSocket, WebSocketDisconnect
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from pydantic import BaseModel
 
 from src.nostr.client import NostrClient
@@ -68,6 +69,10 @@ class MCPServer:
         async def health():
             return {"status": "healthy"}
         
+        @self.app.get("/metrics")
+        async def metrics():
+            return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+        
         @self.app.websocket("/ws")
         async def websocket_endpoint(websocket: WebSocket):
             await self._handle_websocket(websocket)
@@ -228,7 +233,7 @@ class MCPServer:
         for client in self.websocket_clients:
             try:
                 await client.send_text(message_json)
-            except:
+            except Exception:
                 disconnected_clients.append(client)
         
         # Remove disconnected clients
@@ -2,20 +2,33 @@
 Interactive Setup Wizard for Dandelions
 """
 
+import asyncio
+import importlib
 import os
 import sys
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 import questionary
+import websockets
+import yaml
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from src.llm.providers import PROVIDERS
+
 console = Console()
 
+# Prefer the libyaml-backed dumper, falling back to pure Python
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+def _valid_port(value: str) -> bool:
+    """Validate an unprivileged TCP port number"""
+    return value.isdigit() and 1024 <= int(value) <= 65535
+
 class SetupWizard:
     """Interactive setup wizard for Dandelions"""
     
@@ -152,13 +165,8 @@ class SetupWizard:
         
         # Available providers
         provider_options = [
-            {"name": "DeepSeek AI", "value": "deepseek"},
-            {"name": "Mistral AI", "value": "mistral"},
-            {"name": "OpenAI", "value": "openai"},
-            {"name": "Anthropic Claude", "value": "anthropic"},
-            {"name": "Ollama (Local)", "value": "ollama"},
-            {"name": "Groq", "value": "groq"},
-            {"name": "Together AI", "value": "together"}
+            {"name": spec.display_name, "value": name}
+            for name, spec in PROVIDERS.items()
         ]
         
         selected_providers = await questionary.checkbox(
@@ -171,26 +179,18 @@ class SetupWizard:
         for provider in selected_providers:
             console.print(f"\n[bold yellow]Configuring {provider.upper()}[/bold yellow]")
             
+            spec = PROVIDERS[provider]
+            
             # API Key
             api_key = await questionary.password(
                 f"Enter {provider} API key:",
-                validate=lambda x: len(x) > 10 if x else True
+                validate=lambda x: spec.validate_key(x) if x else True
             ).ask_async()
             
             # Model selection
-            default_models = {
-                "deepseek": "deepseek-chat",
-                "mistral": "mistral-medium",
-                "openai": "gpt-4-turbo-preview",
-                "anthropic": "claude-3-opus-20240229",
-                "ollama": "llama2",
-                "groq": "mixtral-8x7b-32768",
-                "together": "togethercomputer/llama-2-70b-chat"
-            }
-            
             model = await questionary.text(
-                f"Model name (default: {default_models[provider]}):",
-                default=default_models[provider]
+                f"Model name (default: {spec.default_model}):",
+                default=spec.default_model
             ).ask_async()
             
             # Priority
@@ -224,7 +224,7 @@ class SetupWizard:
         port = await questionary.text(
             "MCP server port:",
             default="8080",
-            validate=lambda x: x.isdigit() and 1024 <= int(x) <= 65535
+            validate=_valid_port
         ).ask_async()
         
         return {
@@ -248,7 +248,7 @@ class SetupWizard:
         port = await questionary.text(
             "Web UI port:",
             default="8501",
-            validate=lambda x: x.isdigit() and 1024 <= int(x) <= 65535
+            validate=_valid_port
         ).ask_async()
         
         auth_enabled = await questionary.confirm(
@@ -278,9 +278,8 @@ class SetupWizard:
             task = progress.add_task("Saving configuration...", total=None)
             
             # Save YAML config
-            import yaml
             with open(self.config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+                yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False)
             
             # Save .env file
             env_lines = []
@@ -293,8 +292,7 @@ class SetupWizard:
             for provider, provider_config in config['llm_providers'].items():
                 env_lines.append(f"{provider.upper()}_API_KEY={provider_config['api_key']}")
             
-            with open(self.env_file, 'w') as f:
-                f.write('\n'.join(env_lines))
+            self.env_file.write_text('\n'.join(env_lines))
             
             progress.update(task, completed=True)
         
@@ -307,21 +305,71 @@ class SetupWizard:
         console.print("\n[bold cyan]Step 5: Testing Connections[/bold cyan]")
         console.print("-" * 40)
         
-        # This would be implemented to actually test connections
-        # For now, just show a simulated test
+        relays = config['nostr']['relays']
+        providers = config['llm_providers']
         
+        tasks = [
+            asyncio.create_task(self._probe_relay(url)) for url in relays
+        ] + [
+            asyncio.create_task(self._probe_provider(name, provider_config))
+            for name, provider_config in providers.items()
+        ]
+        
+        failures = []
         with Progress() as progress:
-            task1 = progress.add_task("[cyan]Testing Nostr relays...", total=100)
-            for i in range(100):
-                progress.update(task1, advance=1)
-                await asyncio.sleep(0.01)
+            progress_tasks = {
+                "relay": progress.add_task("[cyan]Testing Nostr relays...", total=len(relays)),
+                "provider": progress.add_task("[cyan]Testing LLM providers...", total=len(providers))
+            }
             
-            task2 = progress.add_task("[cyan]Testing LLM providers...", total=100)
-            for i in range(100):
-                progress.update(task2, advance=1)
-                await asyncio.sleep(0.01)
-        
-        console.print("\n[bold green]✓ All connections successful![/bold green]")
+            for next_done in asyncio.as_completed(tasks):
+                kind, name, ok = await next_done
+                progress.update(progress_tasks[kind], advance=1)
+                if not ok:
+                    failures.append(name)
+        
+        if failures:
+            console.print("\n[bold yellow]⚠ Some connections failed:[/bold yellow]")
+            for name in failures:
+                console.print(f"  • {name}")
+        else:
+            console.print("\n[bold green]✓ All connections successful![/bold green]")
+    
+    async def _probe_relay(self, url: str) -> Tuple[str, str, bool]:
+        """Check that a Nostr relay accepts a WebSocket connection"""
+        try:
+            async with websockets.connect(url, open_timeout=2):
+                return "relay", url, True
+        except (OSError, asyncio.TimeoutError, websockets.WebSocketException):
+            return "relay", url, False
+    
+    async def _probe_provider(self, name: str, provider_config: Dict[str, Any]) -> Tuple[str, str, bool]:
+        """Check that an LLM provider accepts the configured credentials"""
+        from src.llm.manager import LLMConfig, LLMProvider
+        
+        try:
+            provider = LLMProvider(name)
+            module = importlib.import_module(f"src.llm.{provider.value}")
+            provider_class = getattr(module, f"{provider.name.capitalize()}Provider")
+        except (ValueError, ImportError, AttributeError):
+            return "provider", name, False
+        
+        try:
+            instance = provider_class(LLMConfig(
+                provider=provider,
+                api_key=provider_config.get('api_key'),
+                model=provider_config.get('model')
+            ))
+            await instance.initialize()
+        except Exception:
+            return "provider", name, False
+        
+        try:
+            return "provider", name, await instance.test_connection()
+        except Exception:
+            return "provider", name, False
+        finally:
+            await instance.close()
     
     def _display_completion(self):
         """Display completion message"""
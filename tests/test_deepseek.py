@@ -0,0 +1,239 @@
+"""
+Tests for the DeepSeek provider
+"""
+
+import asyncio
+import gc
+
+import httpx
+import msgspec
+import pytest
+
+from src.llm._http import BearerAuth
+from src.llm.deepseek import DeepSeekProvider, DeepSeekResponse
+from src.llm.manager import LLMConfig, LLMProvider
+
+# Shape of a real chat completion, including nested usage details
+REALISTIC_RESPONSE = {
+    "id": "930c60df-bf64-41c9-a88e-3ec75f81e00e",
+    "object": "chat.completion",
+    "created": 1705651092,
+    "model": "deepseek-chat",
+    "system_fingerprint": "fp_3a5770e1b4",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hello! How can I help?"},
+            "logprobs": None,
+            "finish_reason": "stop"
+        }
+    ],
+    "usage": {
+        "prompt_tokens": 16,
+        "completion_tokens": 10,
+        "total_tokens": 26,
+        "prompt_tokens_details": {"cached_tokens": 0},
+        "completion_tokens_details": {"reasoning_tokens": 0},
+        "prompt_cache_hit_tokens": 0,
+        "prompt_cache_miss_tokens": 16
+    }
+}
+
+
+def make_provider(handler) -> DeepSeekProvider:
+    provider = DeepSeekProvider(LLMConfig(
+        provider=LLMProvider.DEEPSEEK,
+        api_key="sk-test",
+        model="deepseek-chat"
+    ))
+    provider.client = httpx.AsyncClient(
+        base_url=provider.base_url,
+        transport=httpx.MockTransport(handler)
+    )
+    provider._auth = BearerAuth(lambda: provider._api_key)
+    return provider
+
+
+def test_decode_realistic_response():
+    data = msgspec.json.decode(
+        msgspec.json.encode(REALISTIC_RESPONSE), type=DeepSeekResponse
+    )
+
+    assert data.choices[0].message.content == "Hello! How can I help?"
+    assert data.usage.prompt_tokens == 16
+    assert data.usage.completion_tokens == 10
+
+
+@pytest.mark.asyncio
+async def test_generate_parses_realistic_response():
+    provider = make_provider(lambda request: httpx.Response(200, json=REALISTIC_RESPONSE))
+
+    result = await provider.generate("Hi")
+
+    assert result["content"] == "Hello! How can I help?"
+    assert result["usage"]["prompt_tokens"] == 16
+    assert result["cost"] > 0
+
+
+@pytest.mark.asyncio
+async def test_generate_does_not_send_config_kwarg():
+    sent = []
+
+    def handler(request):
+        sent.append(msgspec.json.decode(request.content))
+        return httpx.Response(200, json=REALISTIC_RESPONSE)
+
+    provider = make_provider(handler)
+    override = LLMConfig(
+        provider=LLMProvider.DEEPSEEK,
+        api_key="sk-other",
+        model="deepseek-reasoner",
+        temperature=0.1
+    )
+
+    await provider.generate("Hi", config=override, top_p=0.5, not_an_api_param=1)
+
+    body = sent[0]
+    assert "config" not in body
+    assert "not_an_api_param" not in body
+    assert body["model"] == "deepseek-reasoner"
+    assert body["temperature"] == 0.1
+    assert body["top_p"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_cancelling_first_caller_does_not_cancel_coalesced_callers():
+    release = asyncio.Event()
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await release.wait()
+        return httpx.Response(200, json=REALISTIC_RESPONSE)
+
+    provider = make_provider(handler)
+
+    first = asyncio.create_task(provider.generate("Hi"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(provider.generate("Hi"))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    result = await second
+    assert result["content"] == "Hello! How can I help?"
+    assert len(calls) == 1
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_failed_request_after_caller_timeout_is_not_reported_unretrieved():
+    release = asyncio.Event()
+
+    async def handler(request):
+        await release.wait()
+        return httpx.Response(500)
+
+    provider = make_provider(handler)
+    unhandled = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(provider.generate("Hi"), timeout=0.01)
+
+    (task,) = provider._inflight.values()
+    release.set()
+    # asyncio.wait does not retrieve the task's exception
+    await asyncio.wait({task})
+    del task
+    gc.collect()
+
+    assert not provider._inflight
+    assert not unhandled
+
+
+def sse(*events) -> bytes:
+    lines = [f"data: {msgspec.json.encode(event).decode()}\n\n" for event in events]
+    return ("".join(lines) + "data: [DONE]\n\n").encode()
+
+
+STREAM_BODY = sse(
+    {"model": "deepseek-chat", "choices": [{"index": 0, "delta": {"role": "assistant", "content": ""}}]},
+    {"model": "deepseek-chat", "choices": [{"index": 0, "delta": {"content": "Hello"}}]},
+    {"model": "deepseek-chat", "choices": [{"index": 0, "delta": {"content": " there"}}]},
+    {
+        "model": "deepseek-chat",
+        "choices": [],
+        "usage": {"prompt_tokens": 5, "completion_tokens": 2, "total_tokens": 7}
+    }
+)
+
+
+@pytest.mark.asyncio
+async def test_generate_stream_yields_deltas_then_serves_from_cache():
+    sent = []
+
+    def handler(request):
+        sent.append(msgspec.json.decode(request.content))
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=STREAM_BODY
+        )
+
+    provider = make_provider(handler)
+
+    chunks = [chunk async for chunk in provider.generate_stream("Hi")]
+
+    assert sent[0]["stream"] is True
+    assert [c["content"] for c in chunks] == ["Hello", " there", ""]
+    assert chunks[-1]["usage"]["completion_tokens"] == 2
+    assert chunks[-1]["cost"] > 0
+
+    cached = [chunk async for chunk in provider.generate_stream("Hi")]
+
+    assert len(sent) == 1
+    assert len(cached) == 1
+    assert cached[0]["content"] == "Hello there"
+    assert cached[0]["usage"]["prompt_tokens"] == 5
+
+
+class BrokenSemanticCache:
+    """Semantic tier whose model cannot be loaded"""
+
+    loaded = False
+
+    async def embed(self, prompt):
+        raise OSError("model download failed")
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_failure_falls_back_to_api():
+    provider = make_provider(lambda request: httpx.Response(200, json=REALISTIC_RESPONSE))
+    provider._semantic = BrokenSemanticCache()
+
+    result = await provider.generate("Hi")
+
+    assert result["content"] == "Hello! How can I help?"
+    assert provider._semantic is None
+
+
+def test_configured_api_key_wins_over_environment(monkeypatch):
+    monkeypatch.setenv("DEEPSEEK_API_KEY", "sk-old-env")
+    provider = make_provider(lambda request: httpx.Response(200, json=REALISTIC_RESPONSE))
+    assert provider._api_key == "sk-test"
+
+
+def test_reload_key_takes_rotated_key_from_environment(monkeypatch):
+    monkeypatch.delenv("DEEPSEEK_API_KEY", raising=False)
+    provider = make_provider(lambda request: httpx.Response(200, json=REALISTIC_RESPONSE))
+
+    provider.reload_key()
+    assert provider._api_key == "sk-test"
+
+    monkeypatch.setenv("DEEPSEEK_API_KEY", "sk-rotated")
+    provider.reload_key()
+    assert provider._api_key == "sk-rotated"
@@ -0,0 +1,37 @@
+"""
+Tests for the shared HTTP client pool
+"""
+
+import pytest
+
+from src.llm._http import get_shared_client, release_shared_client
+
+
+@pytest.mark.asyncio
+async def test_client_is_shared_and_closed_after_last_release():
+    first = await get_shared_client("https://api.example.com")
+    second = await get_shared_client("https://api.example.com")
+    assert first is second
+
+    await release_shared_client(first)
+    assert not first.is_closed
+
+    await release_shared_client(second)
+    assert first.is_closed
+
+
+@pytest.mark.asyncio
+async def test_stale_holder_does_not_close_replacement_client():
+    stale = await get_shared_client("https://api.example.com")
+    other_stale = await get_shared_client("https://api.example.com")
+    await stale.aclose()
+
+    replacement = await get_shared_client("https://api.example.com")
+    assert replacement is not stale
+
+    await release_shared_client(stale)
+    await release_shared_client(other_stale)
+    assert not replacement.is_closed
+
+    await release_shared_client(replacement)
+    assert replacement.is_closed